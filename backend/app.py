@@ -2,10 +2,15 @@
 Clean Multilingual Chatbot Backend
 Simple Flask API with Groq integration
 """
+import base64
+import io
 import logging
 from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
+from gtts import gTTS
 from llm_service import LLMService
+from stt_service import STTService, transcription_cache
+import http_session
 import config
 
 # Configure logging
@@ -19,8 +24,9 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__, static_folder='static')
 CORS(app)
 
-# Initialize LLM service
+# Initialize LLM and STT services
 llm = LLMService()
+stt = STTService()
 
 logger.info("✅ Chatbot server starting...")
 logger.info(f"✅ Using Groq model: {config.GROQ_MODEL}")
@@ -97,6 +103,12 @@ def status():
         'model': config.GROQ_MODEL
     })
 
+
+@app.route('/api/stt_cache_stats', methods=['GET'])
+def stt_cache_stats():
+    """Transcription cache metrics (hit rate, Whisper seconds saved) for this worker"""
+    return jsonify(transcription_cache.stats())
+
 @app.route('/api/process_text', methods=['POST'])
 def process_text():
     """Compatibility endpoint for text chat"""
@@ -118,9 +130,6 @@ def process_text():
         # Get AI response with correct language
         ai_response = llm.get_response(user_message, language, user_id)
         # Generate TTS audio using gTTS
-        from gtts import gTTS
-        import base64
-        import io
         try:
             # Map language codes
             lang_map = {'en': 'en', 'hi': 'hi', 'kn': 'kn', 'te': 'te', 'ta': 'ta', 
@@ -167,10 +176,6 @@ def process_audio():
         
         logger.info(f"Received audio file: {audio_file.filename}")
         
-        # Import STT service
-        from stt_service import STTService
-        stt = STTService()
-        
         # Get language hint from request
         language_hint = request.form.get('language')
         if language_hint == '':
@@ -192,9 +197,6 @@ def process_audio():
         
         # Return both transcription and response
         # Generate TTS audio for the response
-        from gtts import gTTS
-        import base64
-        import io
         try:
             lang_map = {'en': 'en', 'hi': 'hi', 'kn': 'kn', 'te': 'te', 'ta': 'ta',
                         'ml': 'ml', 'mr': 'mr', 'bn': 'bn', 'gu': 'gu', 'pa': 'hi'}
@@ -238,10 +240,6 @@ def tts_only():
         logger.info(f"TTS request: {text[:50]}... (lang: {language}, speed: {speed})")
         
         # Use gTTS for multilingual support
-        from gtts import gTTS
-        import base64
-        import io
-        
         # Map language codes to gTTS supported codes
         lang_map = {
             'en': 'en',
@@ -281,6 +279,23 @@ def tts_only():
         logger.error(f"TTS error: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
 
+def _log_warmup(timings: dict):
+    """Log the upstream connections opened by warmup"""
+    for url, seconds in timings.items():
+        if seconds is not None:
+            logger.info(f"✅ Warmed connection to {url} in {seconds * 1000:.0f} ms")
+
+
+def warmup():
+    """
+    Pre-open pooled upstream connections so the first requests on a
+    worker don't pay for DNS + TLS setup. Called per worker by the
+    gunicorn post_fork hook (see gunicorn.conf.py). Runs in a background
+    thread so worker boot is never blocked on the upstreams.
+    """
+    return http_session.warmup_in_background(callback=_log_warmup)
+
+
 if __name__ == '__main__':
     logger.info(f"🚀 Starting server on http://localhost:{config.PORT}")
     logger.info("✨ Clean chatbot ready!")
@@ -0,0 +1,138 @@
+"""
+Cold-start latency measurement for Pragna-1 A
+Shows what the first request on a fresh worker pays with and without
+the gunicorn boot warmup
+
+1. Handler imports: cost of the modules the request handlers used to
+   import lazily, on top of what the app already imported at boot.
+2. First request: starts `gunicorn -c gunicorn.conf.py` with the
+   post_fork warmup on and off, and times the first real /api/process_text
+   request on each fresh worker. Needs GROQ_API_KEY and network access to
+   exercise the upstreams; without them the request short-circuits.
+
+Usage:
+    python bench_cold_start.py [rounds]
+"""
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import requests
+import config
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# What the baseline app already imported at boot (app.py -> llm_service -> requests, config)
+BASELINE_IMPORTS = "import flask, flask_cors, llm_service, config"
+
+# Modules the request handlers used to import lazily on first use
+HANDLER_IMPORTS = "from gtts import gTTS; import base64, io; import stt_service"
+
+IMPORT_SNIPPET = f"""
+import time
+{BASELINE_IMPORTS}
+start = time.perf_counter()
+{HANDLER_IMPORTS}
+print(time.perf_counter() - start)
+"""
+
+# Time allowed for the background warmup to finish before the first request
+WARMUP_SETTLE_SECONDS = 3
+
+
+def measure_handler_imports(rounds: int) -> float:
+    """Median seconds to import the handler modules in a fresh interpreter"""
+    times = []
+    for _ in range(rounds):
+        result = subprocess.run(
+            [sys.executable, '-c', IMPORT_SNIPPET],
+            capture_output=True, text=True, timeout=60, cwd=HERE
+        )
+        if result.returncode != 0:
+            raise RuntimeError((result.stderr.strip().splitlines() or [f"exit {result.returncode}"])[-1])
+        times.append(float(result.stdout))
+    return statistics.median(times)
+
+
+def _free_port() -> int:
+    """Pick an unused local port"""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _wait_for_port(port: int, timeout: float = 30):
+    """Wait until gunicorn is listening (TCP connect only - doesn't hit the app)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"gunicorn did not start on port {port}")
+
+
+def measure_first_request(warmup: bool) -> tuple:
+    """
+    Boot a fresh gunicorn and time its first and second /api/process_text requests
+
+    Returns:
+        Tuple of (first_seconds, second_seconds, got_audio) where got_audio
+        is True only if both responses carried gTTS audio
+
+    Raises:
+        RuntimeError: If either request doesn't return 200
+    """
+    port = _free_port()
+    env = dict(os.environ, PORT=str(port), GUNICORN_WARMUP=str(warmup), LOG_LEVEL='warning')
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'app:app'],
+        cwd=HERE, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_for_port(port)
+        time.sleep(WARMUP_SETTLE_SECONDS)
+
+        url = f"http://127.0.0.1:{port}/api/process_text"
+        timings = []
+        got_audio = True
+        for _ in range(2):
+            start = time.perf_counter()
+            response = requests.post(url, json={'text': 'Hi', 'language': 'en', 'user_id': 'bench'}, timeout=120)
+            timings.append(time.perf_counter() - start)
+
+            if response.status_code != 200:
+                raise RuntimeError(f"/api/process_text returned {response.status_code}: {response.text[:200]}")
+            got_audio = got_audio and bool(response.json().get('audio_response'))
+        return timings[0], timings[1], got_audio
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main(rounds: int = 3):
+    import_ms = measure_handler_imports(rounds) * 1000
+    print(f"Handler imports (beyond baseline boot imports): {import_ms:7.1f} ms")
+
+    if not config.GROQ_API_KEY:
+        print("⚠️ GROQ_API_KEY not set - first-request numbers won't include upstream calls")
+
+    for warmup in (False, True):
+        results = [measure_first_request(warmup) for _ in range(rounds)]
+        first = statistics.median(r[0] for r in results) * 1000
+        second = statistics.median(r[1] for r in results) * 1000
+        with_audio = sum(1 for r in results if r[2])
+        label = 'with warmup' if warmup else 'no warmup  '
+        print(
+            f"First request {label}: {first:7.1f} ms  (second request: {second:7.1f} ms, "
+            f"TTS audio in {with_audio}/{rounds} runs)"
+        )
+
+    print("Numbers are only comparable when every run returned TTS audio with GROQ_API_KEY set")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
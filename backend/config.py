@@ -30,9 +30,20 @@ SERPER_API_KEY = os.getenv('SERPER_API_KEY', '')
 SERPER_ENABLED = os.getenv('SERPER_ENABLED', 'True').lower() == 'true'
 SERPER_TIMEOUT = int(os.getenv('SERPER_TIMEOUT', 10))
 
+# Upstream HTTP connection pool (per worker) - sized to the gunicorn thread count
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', 4))
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', os.getenv('GUNICORN_THREADS', 16)))
+
 # Whisper Configuration for STT
 WHISPER_MODEL_SIZE = os.getenv('WHISPER_MODEL_SIZE', 'base')
 
+# Transcription Cache (dedupes repeated voice uploads)
+STT_CACHE_ENABLED = os.getenv('STT_CACHE_ENABLED', 'True').lower() == 'true'
+STT_CACHE_MAX_BYTES = int(os.getenv('STT_CACHE_MAX_BYTES', 4 * 1024 * 1024))
+STT_CACHE_TTL = int(os.getenv('STT_CACHE_TTL', 3600))
+STT_CACHE_DIR = os.getenv('STT_CACHE_DIR', '')  # Shared disk tier, empty = memory only
+STT_CACHE_DISK_MAX_BYTES = int(os.getenv('STT_CACHE_DISK_MAX_BYTES', 64 * 1024 * 1024))
+
 # Audio Configuration
 AUDIO_SAMPLE_RATE = int(os.getenv('AUDIO_SAMPLE_RATE', 16000))
 
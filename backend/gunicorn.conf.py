@@ -0,0 +1,44 @@
+"""
+Gunicorn production profile for Pragna-1 A
+
+Requests spend most of their time waiting on upstream APIs (Groq chat,
+Groq Whisper, gTTS), so we run threaded workers instead of the default
+sync worker. The app is preloaded in the master so imports happen once
+before forking; each worker then pre-opens its own Groq connections
+(gTTS opens a fresh connection per call and can't be pre-warmed).
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', os.getenv('FLASK_PORT', 5000))}"
+
+# Conversation history and the STT cache memory tier live in-process, so a
+# single worker keeps every user's turns together - scale with threads.
+# Only raise WEB_CONCURRENCY once history moves to shared storage.
+worker_class = 'gthread'
+workers = int(os.getenv('WEB_CONCURRENCY', 1))
+# HTTP_POOL_MAXSIZE defaults to this so every thread can keep a pooled connection
+threads = int(os.getenv('GUNICORN_THREADS', 16))
+
+# Import the app (Flask, gTTS, STT/LLM services) once in the master
+preload_app = True
+
+# Worker heartbeat: restart a worker whose main loop stops responding.
+# With gthread this does not bound request duration - upstream calls are
+# limited by their own timeouts (GROQ_TIMEOUT, gTTS timeout)
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 90))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
+
+# Pre-open upstream connections in each worker (set to False to compare cold starts)
+warmup_enabled = os.getenv('GUNICORN_WARMUP', 'True').lower() == 'true'
+
+
+def post_fork(server, worker):
+    """Warm upstream connections per worker (sockets must not be shared across forks)"""
+    if warmup_enabled:
+        import app
+        app.warmup()
@@ -0,0 +1,73 @@
+"""
+Shared HTTP session for Pragna-1 A
+Pools keep-alive connections to the upstream APIs (Groq chat + Whisper)
+so requests reuse TLS connections instead of opening a new one each time
+
+gTTS is not covered: it opens its own requests.Session() per call, so its
+connections can't be pooled or pre-opened from here.
+"""
+import http.cookiejar
+import logging
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+import config
+
+logger = logging.getLogger(__name__)
+
+# Upstream hosts to pre-connect during worker warmup
+UPSTREAM_URLS = [
+    "https://api.groq.com/openai/v1/models",
+]
+
+session = requests.Session()
+# Only the connection pool is shared - never replay upstream cookies across users
+session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_adapter = HTTPAdapter(
+    pool_connections=config.HTTP_POOL_CONNECTIONS,
+    pool_maxsize=config.HTTP_POOL_MAXSIZE
+)
+session.mount('https://', _adapter)
+session.mount('http://', _adapter)
+
+
+def warmup(timeout: float = 2) -> dict:
+    """
+    Open pooled connections to the upstream APIs
+
+    Must run after fork (once per worker) - sockets opened in the
+    gunicorn master would be shared between workers.
+
+    Returns:
+        Dict of url -> seconds taken (None if the upstream was unreachable)
+    """
+    timings = {}
+    for url in UPSTREAM_URLS:
+        start = time.monotonic()
+        try:
+            # Any response (even 401) leaves a warm TLS connection in the pool
+            session.get(url, timeout=timeout)
+            timings[url] = time.monotonic() - start
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"⚠️ Warmup connection to {url} failed: {e}")
+            timings[url] = None
+    return timings
+
+
+def warmup_in_background(callback=None) -> threading.Thread:
+    """
+    Run warmup() in a daemon thread so an unreachable upstream never
+    delays worker boot
+
+    Args:
+        callback: Optional function called with the timings dict when done
+    """
+    def run():
+        timings = warmup()
+        if callback:
+            callback(timings)
+
+    thread = threading.Thread(target=run, name='upstream-warmup', daemon=True)
+    thread.start()
+    return thread
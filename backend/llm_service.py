@@ -3,8 +3,10 @@ LLM Service for Pragna-1 A
 Uses Groq API for fast, multilingual chat responses
 """
 import logging
+import threading
 import requests
 import config
+from http_session import session
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,8 @@ class LLMService:
         # Conversation history per user
         self.conversation_history = {}
         self.max_history = config.CONVERSATION_HISTORY_SIZE
+        # Guards conversation_history across gunicorn worker threads
+        self._history_lock = threading.RLock()
         
         if not self.api_key:
             logger.warning("⚠️ GROQ_API_KEY not set - LLM service will not work")
@@ -40,24 +44,27 @@ For factual questions, provide accurate information."""
     
     def _get_history(self, user_id: str) -> list:
         """Get conversation history for a user"""
-        if user_id not in self.conversation_history:
-            self.conversation_history[user_id] = []
-        return self.conversation_history[user_id]
+        with self._history_lock:
+            if user_id not in self.conversation_history:
+                self.conversation_history[user_id] = []
+            return self.conversation_history[user_id]
     
     def _add_to_history(self, user_id: str, role: str, content: str):
         """Add a message to conversation history"""
-        history = self._get_history(user_id)
-        history.append({"role": role, "content": content})
-        
-        # Trim history if too long (keep last N messages)
-        if len(history) > self.max_history * 2:
-            self.conversation_history[user_id] = history[-self.max_history * 2:]
+        with self._history_lock:
+            history = self._get_history(user_id)
+            history.append({"role": role, "content": content})
+            
+            # Trim history if too long (keep last N messages)
+            if len(history) > self.max_history * 2:
+                self.conversation_history[user_id] = history[-self.max_history * 2:]
     
     def clear_history(self, user_id: str):
         """Clear conversation history for a user"""
-        if user_id in self.conversation_history:
-            del self.conversation_history[user_id]
-            logger.info(f"Cleared history for user: {user_id}")
+        with self._history_lock:
+            if user_id in self.conversation_history:
+                del self.conversation_history[user_id]
+                logger.info(f"Cleared history for user: {user_id}")
     
     def get_response(self, message: str, language: str = 'en', user_id: str = 'default') -> str:
         """
@@ -80,8 +87,8 @@ For factual questions, provide accurate information."""
             messages = [{"role": "system", "content": system_prompt}]
             
             # Add conversation history
-            history = self._get_history(user_id)
-            messages.extend(history[-10:])  # Last 5 exchanges (10 messages)
+            with self._history_lock:
+                messages.extend(self._get_history(user_id)[-10:])  # Last 5 exchanges (10 messages)
             
             # Add current message
             messages.append({"role": "user", "content": message})
@@ -102,7 +109,7 @@ For factual questions, provide accurate information."""
             
             logger.info(f"Sending request to Groq API with model: {self.model}")
             
-            response = requests.post(
+            response = session.post(
                 self.api_url,
                 headers=headers,
                 json=payload,
@@ -115,9 +122,10 @@ For factual questions, provide accurate information."""
             # Extract response text
             ai_response = result['choices'][0]['message']['content'].strip()
             
-            # Update conversation history
-            self._add_to_history(user_id, "user", message)
-            self._add_to_history(user_id, "assistant", ai_response)
+            # Update conversation history (keep the exchange together)
+            with self._history_lock:
+                self._add_to_history(user_id, "user", message)
+                self._add_to_history(user_id, "assistant", ai_response)
             
             logger.info(f"Got response: {ai_response[:100]}...")
             return ai_response
@@ -6,11 +6,17 @@ import logging
 import io
 import os
 import tempfile
+import time
 import requests
 import config
+from http_session import session
+from transcription_cache import TranscriptionCache
 
 logger = logging.getLogger(__name__)
 
+# Shared by every STTService instance in this worker
+transcription_cache = TranscriptionCache()
+
 
 class STTService:
     """Speech-to-Text Service using Groq's FREE Whisper API"""
@@ -20,6 +26,7 @@ class STTService:
         self.api_key = config.GROQ_API_KEY
         self.api_url = "https://api.groq.com/openai/v1/audio/transcriptions"
         self.timeout = config.GROQ_TIMEOUT
+        self.cache = transcription_cache
         
         if not self.api_key:
             logger.warning("⚠️ GROQ_API_KEY not set - STT service will not work")
@@ -51,6 +58,13 @@ class STTService:
             
             logger.info(f"Received audio data: {len(audio_data)} bytes")
             
+            # Skip Whisper and language detection for audio we've already transcribed
+            cache_key = self.cache.make_key(audio_data, language)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"STT cache hit: {cached[0][:100]}... (lang: {cached[1]})")
+                return cached
+            
             # Create a temporary file for the audio
             with tempfile.NamedTemporaryFile(suffix='.webm', delete=False) as temp_file:
                 temp_file.write(audio_data)
@@ -79,12 +93,14 @@ class STTService:
                     else:
                         logger.info("Sending audio to Groq Whisper (auto-detect language)")
                     
-                    response = requests.post(
+                    whisper_start = time.monotonic()
+                    response = session.post(
                         self.api_url,
                         headers=headers,
                         files=files,
                         timeout=self.timeout
                     )
+                    whisper_seconds = time.monotonic() - whisper_start
                 
                 # Log response for debugging
                 if response.status_code != 200:
@@ -104,6 +120,8 @@ class STTService:
                 
                 logger.info(f"Transcribed: {transcribed_text[:100]}... (lang: {detected_language})")
                 
+                self.cache.put(cache_key, transcribed_text, detected_language, whisper_seconds)
+                
                 return transcribed_text, detected_language
                 
             finally:
@@ -0,0 +1,102 @@
+"""
+Tests for the transcription cache (memory LRU tier + shared disk tier)
+Run from backend/: python -m pytest -q
+"""
+import json
+import os
+import time
+import pytest
+import config
+import transcription_cache
+from transcription_cache import TranscriptionCache
+
+
+@pytest.fixture
+def make_cache(tmp_path, monkeypatch):
+    """Build a TranscriptionCache with patched config values"""
+    def factory(max_bytes=1024 * 1024, ttl=3600, cache_dir=str(tmp_path), disk_max_bytes=1024 * 1024):
+        monkeypatch.setattr(config, 'STT_CACHE_ENABLED', True)
+        monkeypatch.setattr(config, 'STT_CACHE_MAX_BYTES', max_bytes)
+        monkeypatch.setattr(config, 'STT_CACHE_TTL', ttl)
+        monkeypatch.setattr(config, 'STT_CACHE_DIR', cache_dir)
+        monkeypatch.setattr(config, 'STT_CACHE_DISK_MAX_BYTES', disk_max_bytes)
+        return TranscriptionCache()
+    return factory
+
+
+def test_oversized_insert_evicts_oldest(make_cache):
+    cache = make_cache(cache_dir='')
+    keys = [cache.make_key(bytes([i])) for i in range(3)]
+    entry_size = cache._entry_size(keys[0], {
+        'text': 'x' * 100, 'language': 'en', 'whisper_seconds': 1.0, 'created_at': time.time()
+    })
+    cache.max_bytes = entry_size * 2
+
+    for key in keys:
+        cache.put(key, 'x' * 100, 'en', 1.0)
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) == ('x' * 100, 'en')
+    assert cache.get(keys[2]) == ('x' * 100, 'en')
+    assert cache.stats()['bytes'] <= cache.max_bytes
+
+
+def test_expired_entries_miss_in_both_tiers(make_cache, tmp_path, monkeypatch):
+    cache = make_cache(ttl=10)
+    key = cache.make_key(b'audio')
+    cache.put(key, 'hello', 'en', 1.0)
+
+    later = time.time() + 60
+    monkeypatch.setattr(transcription_cache.time, 'time', lambda: later)
+
+    assert cache.get(key) is None
+    assert key not in cache._entries
+    assert not (tmp_path / f"{key}.json").exists()
+    assert cache.stats()['misses'] == 1
+
+
+def test_disk_hit_from_second_instance(make_cache):
+    writer = make_cache()
+    key = writer.make_key(b'audio', 'hi')
+    writer.put(key, 'नमस्ते', 'hi', 2.5)
+
+    reader = make_cache()
+    assert reader.get(key) == ('नमस्ते', 'hi')
+
+    stats = reader.stats()
+    assert stats['hits'] == 1
+    assert stats['disk_hits'] == 1
+    assert stats['whisper_seconds_saved'] == 2.5
+    assert key in reader._entries  # Promoted to the memory tier
+
+
+@pytest.mark.parametrize('content', ['[]', 'not json', json.dumps({'created_at': time.time() + 1e6})])
+def test_malformed_disk_file_is_removed(make_cache, tmp_path, content):
+    cache = make_cache()
+    key = cache.make_key(b'audio')
+    path = tmp_path / f"{key}.json"
+    path.write_text(content, encoding='utf-8')
+
+    assert cache.get(key) is None
+    assert not path.exists()
+
+
+def test_sweep_brings_disk_under_cap(make_cache, tmp_path):
+    cache = make_cache(disk_max_bytes=10 ** 9)
+    now = time.time()
+    for i in range(10):
+        key = f"k{i}"
+        cache._put_disk(key, {'text': 'x' * 100, 'language': 'en', 'whisper_seconds': 1.0, 'created_at': now})
+        os.utime(tmp_path / f"{key}.json", (now - 100 + i, now - 100 + i))
+
+    stale_tmp = tmp_path / 'crashed.tmp'
+    stale_tmp.write_text('partial')
+    os.utime(stale_tmp, (0, 0))
+
+    file_size = (tmp_path / 'k0.json').stat().st_size
+    cache.disk_max_bytes = file_size * 3
+    cache._sweep_disk()
+
+    remaining = sorted(p.name for p in tmp_path.iterdir())
+    assert remaining == ['k7.json', 'k8.json', 'k9.json']
+    assert sum(p.stat().st_size for p in tmp_path.iterdir()) <= cache.disk_max_bytes
@@ -0,0 +1,317 @@
+"""
+Transcription Cache for Pragna-1 A
+Deduplicates repeated voice uploads (client retries, replayed prompt clips)
+by caching Whisper results keyed on a hash of the audio bytes + language hint
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+import config
+
+logger = logging.getLogger(__name__)
+
+# Sweep the disk tier once every N disk writes
+DISK_SWEEP_INTERVAL = 100
+
+# Per-entry bookkeeping not visible to sys.getsizeof on the entry itself:
+# the (entry, size) tuple, the size int and the OrderedDict slot + link node
+ENTRY_OVERHEAD_BYTES = 160
+
+# Leftover .tmp files older than this are from crashed writes
+STALE_TMP_SECONDS = 300
+
+
+class TranscriptionCache:
+    """Two-tier transcription cache: in-memory LRU + optional shared disk tier"""
+
+    def __init__(self):
+        self.enabled = config.STT_CACHE_ENABLED
+        self.max_bytes = config.STT_CACHE_MAX_BYTES
+        self.ttl = config.STT_CACHE_TTL
+        self.cache_dir = config.STT_CACHE_DIR
+        self.disk_max_bytes = config.STT_CACHE_DISK_MAX_BYTES
+
+        # Memory tier: key -> (entry, size_in_bytes), oldest first
+        self._entries = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self._disk_writes = 0
+
+        # Metrics
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.whisper_seconds_saved = 0.0
+
+        if not self.enabled:
+            logger.info("STT cache disabled")
+            return
+
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not create STT cache dir {self.cache_dir}: {e} - disk tier disabled")
+                self.cache_dir = ''
+
+        if self.cache_dir:
+            self._sweep_disk()
+
+        logger.info(
+            f"✅ STT cache enabled (memory: {self.max_bytes} bytes, ttl: {self.ttl}s, "
+            f"disk: {self.cache_dir or 'off'}, disk cap: {self.disk_max_bytes} bytes)"
+        )
+
+    @staticmethod
+    def make_key(audio_data: bytes, language: str = None) -> str:
+        """Build a cache key from the audio content and the language hint"""
+        hint = language if language in config.SUPPORTED_LANGUAGES else 'auto'
+        digest = hashlib.sha256(audio_data).hexdigest()
+        return f"{digest}-{hint}"
+
+    def get(self, key: str):
+        """
+        Look up a cached transcription
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Tuple of (transcribed_text, detected_language) or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        entry = self._get_memory(key, now)
+        from_disk = False
+
+        if entry is None and self.cache_dir:
+            entry = self._get_disk(key, now)
+            if entry is not None:
+                from_disk = True
+                self._put_memory(key, entry)
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            if from_disk:
+                self.disk_hits += 1
+            self.whisper_seconds_saved += entry.get('whisper_seconds', 0.0)
+
+        return entry['text'], entry['language']
+
+    def put(self, key: str, text: str, language: str, whisper_seconds: float):
+        """
+        Store a successful transcription
+
+        Args:
+            key: Key from make_key()
+            text: Transcribed text
+            language: Detected language code
+            whisper_seconds: Time spent in the Whisper call (for savings metrics)
+        """
+        if not self.enabled or not text:
+            return
+
+        entry = {
+            'text': text,
+            'language': language,
+            'whisper_seconds': whisper_seconds,
+            'created_at': time.time()
+        }
+        self._put_memory(key, entry)
+
+        if self.cache_dir:
+            self._put_disk(key, entry)
+
+    def stats(self) -> dict:
+        """Return cache metrics for this worker"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'bytes': self._current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'whisper_seconds_saved': round(self.whisper_seconds_saved, 3)
+            }
+
+    def _is_expired(self, entry: dict, now: float) -> bool:
+        """Check whether an entry has outlived the TTL"""
+        return self.ttl > 0 and now - entry.get('created_at', 0) > self.ttl
+
+    def _get_memory(self, key: str, now: float):
+        """Look up an entry in the memory tier, evicting it if expired"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+
+            entry, size = item
+            if self._is_expired(entry, now):
+                del self._entries[key]
+                self._current_bytes -= size
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def _put_memory(self, key: str, entry: dict):
+        """Insert an entry into the memory tier, evicting LRU entries over the byte cap"""
+        size = self._entry_size(key, entry)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._current_bytes -= old[1]
+
+            self._entries[key] = (entry, size)
+            self._current_bytes += size
+
+            while self._current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+
+    @staticmethod
+    def _entry_size(key: str, entry: dict) -> int:
+        """Estimate the memory footprint of a memory tier entry, in bytes"""
+        return (
+            ENTRY_OVERHEAD_BYTES
+            + sys.getsizeof(key)
+            + sys.getsizeof(entry)
+            + sum(sys.getsizeof(value) for value in entry.values())
+        )
+
+    def _disk_path(self, key: str) -> str:
+        """Path of the disk tier file for a key"""
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _get_disk(self, key: str, now: float):
+        """Look up an entry in the shared disk tier"""
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable STT cache file {path}: {e}")
+            self._unlink(path)
+            return None
+
+        if not self._is_valid_entry(entry):
+            logger.warning(f"Malformed STT cache file {path} - removing")
+            self._unlink(path)
+            return None
+
+        if self._is_expired(entry, now):
+            self._unlink(path)
+            return None
+
+        return entry
+
+    @staticmethod
+    def _is_valid_entry(entry) -> bool:
+        """Check that a disk entry has the shape written by _put_disk"""
+        return (
+            isinstance(entry, dict)
+            and isinstance(entry.get('text'), str)
+            and isinstance(entry.get('language'), str)
+            and isinstance(entry.get('created_at'), (int, float))
+            and isinstance(entry.get('whisper_seconds', 0.0), (int, float))
+        )
+
+    @staticmethod
+    def _unlink(path: str):
+        """Remove a cache file, ignoring races with other workers"""
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def _put_disk(self, key: str, entry: dict):
+        """Write an entry to the shared disk tier atomically"""
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(temp_path, self._disk_path(key))
+        except OSError as e:
+            logger.warning(f"Could not write STT cache entry: {e}")
+            if temp_path:
+                self._unlink(temp_path)
+            return
+
+        with self._lock:
+            self._disk_writes += 1
+            sweep = self._disk_writes % DISK_SWEEP_INTERVAL == 0
+        if sweep:
+            self._sweep_disk()
+
+    def _sweep_disk(self):
+        """
+        Prune the disk tier: remove expired entries and stale .tmp files,
+        then delete the oldest entries until the directory is under the byte cap.
+        Uses file mtimes so entries don't have to be parsed.
+        """
+        now = time.time()
+        files = []
+        total_bytes = 0
+
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError as e:
+            logger.warning(f"Could not sweep STT cache dir {self.cache_dir}: {e}")
+            return
+
+        for name in names:
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Removed by another worker
+
+            age = now - stat.st_mtime
+            if name.endswith('.tmp'):
+                if age > STALE_TMP_SECONDS:
+                    self._unlink(path)
+                continue
+            if not name.endswith('.json'):
+                continue
+            if self.ttl > 0 and age > self.ttl:
+                self._unlink(path)
+                continue
+
+            files.append((stat.st_mtime, stat.st_size, path))
+            total_bytes += stat.st_size
+
+        if total_bytes <= self.disk_max_bytes:
+            return
+
+        files.sort()
+        removed = 0
+        for _, size, path in files:
+            if total_bytes <= self.disk_max_bytes:
+                break
+            self._unlink(path)
+            total_bytes -= size
+            removed += 1
+
+        logger.info(f"STT cache sweep evicted {removed} disk entries")